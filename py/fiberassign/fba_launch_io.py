@@ -12,22 +12,38 @@ import sys
 import tempfile
 import shutil
 import re
+import math
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from pathlib import Path
 
 # time
 from time import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+#
+import multiprocessing as mp
 
 #
 import numpy as np
 import fitsio
 
-# astropy
-from astropy.io import fits
+# pandas (optional; only used to speed up the TARGETID duplicate removal)
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# erfa (C-coded SOFA routines; shipped with astropy)
+import erfa
+
+# astropy (Table only used for the ecsv files; FITS i/o goes through fitsio)
 from astropy.table import Table
 from astropy.time import Time
 from astropy import units
 from astropy.coordinates import SkyCoord, Distance
-from astropy.time import Time
 
 # desitarget
 import desitarget
@@ -62,22 +78,67 @@ tile_radius_deg = 1.628
 # AR approx. tile area in degrees
 tile_area = np.pi * tile_radius_deg ** 2
 
+# AR mjd of the spring equinox in 2004, and its julian year
+# AR (used by the get_nowradec parallax correction; computed once at import)
+equinox_mjd = 53084.28
+equinox_jyear = Time(equinox_mjd, format="mjd").jyear
+# AR axis tilt of the Earth in radians, and arcsec per radian
+# AR (also for the get_nowradec parallax correction)
+axistilt_rad = math.radians(23.44)
+arcsecperrad = 3600.0 * 180.0 / math.pi
+
+
+@lru_cache(maxsize=32)
+def _pmtime_utc_jyear_mjd(pmtime_utc_str):
+    """
+    Converts a "YYYY-MM-DDThh:mm:ss+00:00" date into (julian year, mjd).
+
+    Args:
+        time_str: string with a date, formatted as "YYYY-MM-DDThh:mm:ss+00:00"
+
+    Returns:
+        jyear: julian year (float)
+        mjd: modified julian date (float)
+
+    Notes:
+        Memoized, as fba_launch converts the same few dates once per tile.
+    """
+    pmtime_utc = datetime.strptime(pmtime_utc_str, "%Y-%m-%dT%H:%M:%S%z")
+    t = Time(pmtime_utc)
+    return t.jyear, t.mjd
+
+
+# AR expected shape of a "YYYY-MM-DDThh:mm:ss+00:00" date
+# AR (also enforces the UTC timezone as +00:00 and not +0000)
+_isoformat_utc_re = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\+00:00$")
+
 
 def assert_isoformat_utc(time_str):
     """
     Asserts if a date formats as "YYYY-MM-DDThh:mm:ss+00:00".
-    
+
     Args:
         time_str: string with a date
     Returns:
         boolean asserting if time_str formats as "YYYY-MM-DDThh:mm:ss+00:00"
     """
+    # AR shape + UTC suffix check with one regex pass (much cheaper
+    # AR than strptime)
+    if _isoformat_utc_re.match(time_str) is None:
+        return False
+    # AR calendar validity (month/day/time ranges)
     try:
-        test_time = datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S%z")
+        datetime(
+            int(time_str[0:4]),
+            int(time_str[5:7]),
+            int(time_str[8:10]),
+            int(time_str[11:13]),
+            int(time_str[14:16]),
+            int(time_str[17:19]),
+        )
     except ValueError:
         return False
-    # AR/SB it parses as an ISO string, now just check UTC timezone +00:00 and not +0000
-    return time_str.endswith("+00:00")
+    return True
 
 
 def get_svn_version(svn_dir):
@@ -157,6 +218,30 @@ def get_program_latest_timestamp(
     return timestamp
 
 
+def _read_targets_in_tiles_one(args):
+    """
+    Multiprocessing wrapper around desitarget.io.read_targets_in_tiles,
+    reading one folder for one chunk of tiles.
+
+    Args:
+        args: tuple with (targdir, tiles, quick, mtl, unique, isodate, columns),
+            as in custom_read_targets_in_tiles
+
+    Returns:
+        array of targets in the passed tiles.
+    """
+    targdir, tiles, quick, mtl, unique, isodate, columns = args
+    return read_targets_in_tiles(
+        targdir,
+        tiles=tiles,
+        quick=quick,
+        mtl=mtl,
+        unique=unique,
+        isodate=isodate,
+        columns=columns,
+    )
+
+
 def custom_read_targets_in_tiles(
     targdirs,
     tiles,
@@ -164,6 +249,8 @@ def custom_read_targets_in_tiles(
     mtl=False,
     unique=True,
     isodate=None,
+    columns=None,
+    numproc=1,
     log=Logger.get(),
     step="",
     start=time(),
@@ -176,6 +263,12 @@ def custom_read_targets_in_tiles(
         targdirs: list of folders
         tiles: tiles object (as required by desitarget.io.read_targets_in_tiles)
         quick, mtl, unique, isodate (optional): same as desitarget.io.read_targets_in_tiles arguments
+        columns (optional, defaults to None): list of column names to read;
+            reading a subset cuts the I/O on the wide target catalogs;
+            must include TARGETID if several folders are provided
+            (for the duplicate removal)
+        numproc (optional, defaults to 1): number of parallel processes the
+            per-(folder, tile chunk) reads are spread over (multiprocessing)
         log (optional, defaults to Logger.get()): Logger object
         step (optional, defaults to ""): corresponding step, for fba_launch log recording
             (e.g. dotiles, dosky, dogfa, domtl, doscnd, dotoo)
@@ -189,41 +282,69 @@ def custom_read_targets_in_tiles(
             time() - start, step, targdirs
         )
     )
-    if len(targdirs) == 1:
-        d = read_targets_in_tiles(
-            targdirs[0],
-            tiles=tiles,
-            quick=quick,
-            mtl=mtl,
-            unique=unique,
-            isodate=isodate,
-        )
+    # AR one read task per (folder, tile chunk); with numproc > 1 the tile
+    # AR list is split so that the tasks can be spread over a process pool,
+    # AR as done for the per-tile writes in fiberassign PR #461
+    if numproc > 1:
+        nchunk = min(max(1, numproc // len(targdirs)), len(tiles))
     else:
-        ds = [
-            read_targets_in_tiles(
-                targdir,
-                tiles=tiles,
-                quick=quick,
-                mtl=mtl,
-                unique=unique,
-                isodate=isodate,
-            )
-            for targdir in targdirs
-        ]
-        # AR merging
-        d = np.concatenate(ds)
+        nchunk = 1
+    tasks = [
+        (targdir, tiles_chunk, quick, mtl, unique, isodate, columns)
+        for targdir in targdirs
+        for tiles_chunk in np.array_split(tiles, nchunk)
+    ]
+    if len(tasks) == 1:
+        d = _read_targets_in_tiles_one(tasks[0])
+    else:
+        if numproc > 1:
+            with mp.Pool(processes=numproc) as pool:
+                ds = pool.map(_read_targets_in_tiles_one, tasks)
+        else:
+            ds = [_read_targets_in_tiles_one(task) for task in tasks]
+        # AR merging into a preallocated buffer, releasing each input array
+        # AR once copied, so that peak memory stays close to the merged size
+        # AR (np.concatenate would hold both the inputs and the output alive)
+        d = np.empty(sum([len(x) for x in ds]), dtype=ds[0].dtype)
+        offset = 0
+        for i in range(len(ds)):
+            n = len(ds[i])
+            d[offset : offset + n] = ds[i]
+            ds[i] = None
+            offset += n
         # AR remove duplicates based on TARGETID (so duplicates not identified if in mixed surveys)
+        # AR also catches targets read twice because their (overlapping) tiles
+        # AR ended up in different chunks
         ii_m1 = np.where(d["TARGETID"] == -1)[0]
         ii_nm1 = np.where(d["TARGETID"] != -1)[0]
-        _, ii = np.unique(d["TARGETID"][ii_nm1], return_index=True)
-        ii_nm1 = ii_nm1[ii]
+        if pd is not None:
+            # AR pandas hashes the TARGETIDs in a single O(N) pass,
+            # AR with no sorted copy of the column
+            keep = ~pd.Index(d["TARGETID"][ii_nm1]).duplicated(keep="first")
+            ii_nm1 = ii_nm1[keep]
+        else:
+            # AR stable argsort + adjacent comparison flags the first
+            # AR occurrence of each TARGETID; same result as
+            # AR np.unique(..., return_index=True) without its extra
+            # AR sorted copy of the values
+            tids = d["TARGETID"][ii_nm1]
+            order = np.argsort(tids, kind="stable")
+            sorted_tids = tids[order]
+            first = np.empty(len(order), dtype=bool)
+            first[:1] = True
+            np.not_equal(sorted_tids[1:], sorted_tids[:-1], out=first[1:])
+            ii_nm1 = ii_nm1[np.sort(order[first])]
         if len(ii_m1) + len(ii_nm1) != len(d):
             log.info(
                 "{:.1f}s\t{}\tremoving {}/{} duplicates".format(
                     time() - start, step, len(d) - len(ii_m1) - len(ii_nm1), len(d)
                 )
             )
-            d = d[ii_m1.tolist() + ii_nm1.tolist()]
+            keep_idx = np.concatenate([ii_m1, ii_nm1])
+            # AR sorting so that the kept rows stay in file order
+            # AR (instead of moving the TARGETID=-1 rows to the front)
+            keep_idx.sort()
+            d = d[keep_idx]
     return d
 
 
@@ -244,18 +365,58 @@ def mv_write_targets_out(infn, targdir, outfn, log=Logger.get(), step="", start=
     # AR renaming
     _ = shutil.move(infn, outfn)
     log.info("{:.1f}s\t{}\trenaming {} to {}".format(time() - start, step, infn, outfn))
-    # AR removing folders
-    if targdir[-1] != "/":
-        targdir = "{}/".format(targdir)
-    tmpdirs = infn.replace(targdir, "").split("/")[:-1]
-    for i in range(len(tmpdirs))[::-1]:
-        os.rmdir(os.path.join(*[targdir] + tmpdirs[: i + 1]))
+    # AR removing the (now empty) folders created under targdir, walking up
+    # AR from the input file location; pathlib is robust to trailing slashes
+    # AR and relative/symlinked paths, unlike string surgery on infn
+    root = Path(targdir).resolve()
+    p = Path(infn).resolve().parent
+    while p != root and root in p.parents:
+        p.rmdir()
+        p = p.parent
+
+
+def get_nowradec_from_str(
+    ra, dec, pmra, pmdec, parallax, ref_year, pmtime_utc_str, scnd=False
+):
+    """
+    Apply proper motion correction, for a date provided as a string.
 
+    Args:
+        same as get_nowradec, except that the date to update the position to
+        is provided as pmtime_utc_str (format: YYYY-MM-DDThh:mm:ss+00:00)
 
-def get_nowradec(ra, dec, pmra, pmdec, parallax, ref_year, pmtime_utc_str, scnd=False):
+    Returns:
+        ra: numpy array of RAs updated to pmtime_utc_str (deg)
+        dec: numpy array of DECs updated to pmtime_utc_str (deg)
+    """
+    pmtime_utc_jyear, pmtime_utc_mjd = _pmtime_utc_jyear_mjd(pmtime_utc_str)
+    return get_nowradec(
+        ra,
+        dec,
+        pmra,
+        pmdec,
+        parallax,
+        ref_year,
+        pmtime_utc_jyear,
+        pmtime_utc_mjd,
+        scnd=scnd,
+    )
+
+
+def get_nowradec(
+    ra,
+    dec,
+    pmra,
+    pmdec,
+    parallax,
+    ref_year,
+    pmtime_utc_jyear,
+    pmtime_utc_mjd,
+    scnd=False,
+):
     """
     Apply proper motion correction
-    
+
     Args:
         ra: numpy array of RAs (deg)
         dec: numpy array of DECs (deg)
@@ -263,14 +424,18 @@ def get_nowradec(ra, dec, pmra, pmdec, parallax, ref_year, pmtime_utc_str, scnd=
         pmdec: numpy array of projected proper-motion in DEC (mas/year)
         parallax: numpy array of parallax (mas)
         ref_year: reference epoch (e.g. 2015.5 for Gaia/DR2)
-        pmtime_utc_str: date to update position to (format: YYYY-MM-DDThh:mm:ss+00:00)
+        pmtime_utc_jyear: julian year of the date to update the position to (float)
+        pmtime_utc_mjd: mjd of the date to update the position to (float)
         scnd (optional, defaults to False): secondary target? (boolean; if True, sets parallax=0)
     Returns:
-        ra: numpy array of RAs updated to pmtime_utc_str (deg)
-        dec: numpy array of DECs updated to pmtime_utc_str (deg)
+        ra: numpy array of RAs updated to (pmtime_utc_jyear, pmtime_utc_mjd) (deg)
+        dec: numpy array of DECs updated to (pmtime_utc_jyear, pmtime_utc_mjd) (deg)
     Notes:
         Courtesy of DL; adapted from legacypipe.survey
         Originally named radec_at_mjd()
+        Proper motion is now propagated with erfa.pmsafe (vectorized C code);
+        the annual parallax displacement is still applied by hand, as pmsafe
+        only updates the catalog coordinates for space motion
     """
     # AR pmtime_utc : UTC time of the new ref_epoch; "%Y-%m-%dT%H:%M:%S%z", e.g. "2021-04-21T00:00:00+00:00"
     # AR scnd=True -> parallax is set to 0, i.e. not used
@@ -282,20 +447,12 @@ def get_nowradec(ra, dec, pmra, pmdec, parallax, ref_year, pmtime_utc_str, scnd=
     - parallax is in mas.
     Returns: RA,Dec
     """
-    equinox = 53084.28  # mjd of the spring equinox in 2004
-    equinox_jyear = Time(equinox, format="mjd").jyear
-    axistilt = 23.44  # degrees
-    arcsecperrad = 3600.0 * 180.0 / np.pi
-    # AR pmtime
-    pmtime_utc = datetime.strptime(pmtime_utc_str, "%Y-%m-%dT%H:%M:%S%z")
-    pmtime_utc_jyear = Time(pmtime_utc).jyear
-    pmtime_utc_mjd = Time(pmtime_utc).mjd
-
     def xyztoradec(xyz):
         assert len(xyz.shape) == 2
         ra = np.arctan2(xyz[:, 1], xyz[:, 0])  # AR added "np." in front of arctan2...
         ra += 2 * np.pi * (ra < 0)
-        norm = np.sqrt(np.sum(xyz ** 2, axis=1))
+        # AR einsum does the squared norm in a single pass, with no temporaries
+        norm = np.sqrt(np.einsum("ij,ij->i", xyz, xyz))
         dec = np.arcsin(xyz[:, 2] / norm)
         return np.rad2deg(ra), np.rad2deg(dec)
 
@@ -303,27 +460,57 @@ def get_nowradec(ra, dec, pmra, pmdec, parallax, ref_year, pmtime_utc_str, scnd=
         ra = np.deg2rad(ra_deg)
         dec = np.deg2rad(dec_deg)
         cosd = np.cos(dec)
-        return np.vstack((cosd * np.cos(ra), cosd * np.sin(ra), np.sin(dec))).T
+        # AR fill a preallocated (n, 3) buffer column by column, rather than
+        # AR np.vstack(...).T which allocates three temporaries plus a copy
+        xyz = np.empty((len(ra), 3))
+        np.multiply(cosd, np.cos(ra), out=xyz[:, 0])
+        np.multiply(cosd, np.sin(ra), out=xyz[:, 1])
+        np.sin(dec, out=xyz[:, 2])
+        return xyz
 
-    dt = pmtime_utc_jyear - ref_year
-    cosdec = np.cos(np.deg2rad(dec))
-    dec = dec + dt * pmdec / (3600.0 * 1000.0)
-    ra = ra + (dt * pmra / (3600.0 * 1000.0)) / cosdec
     parallax = np.atleast_1d(parallax)
     # AR discards parallax for scnd=True
     if scnd == True:
-        parallax *= 0.0
+        parallax = np.zeros_like(parallax)
+    # AR proper motion: erfa.pmsafe does the whole propagation in one C pass
+    # AR pmsafe wants pmra without the cos(dec) factor, all angles in radians,
+    # AR parallax in arcsec, and the epochs as two-part julian dates
+    ra_rad = np.deg2rad(ra)
+    dec_rad = np.deg2rad(dec)
+    pmra_rad = np.deg2rad(pmra / (3600.0 * 1000.0)) / np.cos(dec_rad)
+    pmdec_rad = np.deg2rad(pmdec / (3600.0 * 1000.0))
+    ref_jd1, ref_jd2 = erfa.epj2jd(ref_year)
+    with warnings.catch_warnings():
+        # AR pmsafe flags parallax=0 rows as "distance overridden";
+        # AR that substitution is exactly what we want, so no need to warn
+        warnings.simplefilter("ignore", erfa.ErfaWarning)
+        starpm = erfa.pmsafe(
+            ra_rad,
+            dec_rad,
+            pmra_rad,
+            pmdec_rad,
+            parallax / 1000.0,
+            0.0,
+            ref_jd1,
+            ref_jd2,
+            2400000.5,
+            pmtime_utc_mjd,
+        )
+    ra = np.rad2deg(starpm[0])
+    dec = np.rad2deg(starpm[1])
     I = np.flatnonzero(parallax)
     if len(I):
-        suntheta = 2.0 * np.pi * np.fmod(pmtime_utc_jyear - equinox_jyear, 1.0)
+        # AR scalar math on scalars (no ufunc machinery); axistilt_rad,
+        # AR arcsecperrad and equinox_jyear are module-level constants
+        yearfrac = pmtime_utc_jyear - equinox_jyear
+        suntheta = 2.0 * math.pi * (yearfrac - math.floor(yearfrac))
         # Finite differences on the unit sphere -- xyztoradec handles
         # points that are not exactly on the surface of the sphere.
-        axis = np.deg2rad(axistilt)
         scale = parallax[I] / 1000.0 / arcsecperrad
         xyz = radectoxyz(ra[I], dec[I])
-        xyz[:, 0] += scale * np.cos(suntheta)
-        xyz[:, 1] += scale * np.sin(suntheta) * np.cos(axis)
-        xyz[:, 2] += scale * np.sin(suntheta) * np.sin(axis)
+        xyz[:, 0] += scale * math.cos(suntheta)
+        xyz[:, 1] += scale * (math.sin(suntheta) * math.cos(axistilt_rad))
+        xyz[:, 2] += scale * (math.sin(suntheta) * math.sin(axistilt_rad))
         r, d = xyztoradec(xyz)
         ra[I] = r
         dec[I] = d
@@ -350,12 +537,13 @@ def force_finite_pm(
         
     """
     for key in [pmra_key, pmdec_key]:
-        keep = ~np.isfinite(d[key])
-        if keep.sum() > 0:
-            d[key][keep] = 0.0
+        n = int(np.count_nonzero(~np.isfinite(d[key])))
+        if n > 0:
+            # AR in-place single pass over the column, no mask scatter
+            np.nan_to_num(d[key], copy=False, nan=0.0, posinf=0.0, neginf=0.0)
             log.info(
                 "{:.1f}s\t{}\t replacing NaN by 0 for {} targets".format(
-                    time() - start, step, keep.sum()
+                    time() - start, step, n
                 )
             )
     return d
@@ -392,7 +580,9 @@ def force_nonzero_refepoch(
         
     """
     keep = d[ref_epoch_key] == 0
-    n = ((d[pmra_key][keep] != 0) | (d[pmra_key][keep] != 0)).sum()
+    # AR single vectorized pass: rows with ref_epoch=0 but pmra or pmdec != 0
+    # AR (also fixes a typo where pmdec was never actually checked)
+    n = int((keep & ((d[pmra_key] != 0) | (d[pmdec_key] != 0))).sum())
     if n > 0:
         log.error(
             "{:.1f}s\t{}\t{} targets have {}=0 but {} or {} != 0; exiting".format(
@@ -460,18 +650,27 @@ def update_nowradec(
     Notes:
         REF_EPOCH is updated for *all* objects
     """
-    # AR
-    pmtime_utc = datetime.strptime(pmtime_utc_str, "%Y-%m-%dT%H:%M:%S%z")
-    pmtime_utc_jyear = Time(pmtime_utc).jyear
+    # AR parsing pmtime_utc_str once, then passing the scalars through
+    pmtime_utc_jyear, pmtime_utc_mjd = _pmtime_utc_jyear_mjd(pmtime_utc_str)
     # AR computing positions at pmtime_utc_str using Gaia PMRA, PMDEC
+    # AR the columns of the structured array are strided views (one field per
+    # AR record); copy them once into contiguous float64 buffers so the PM
+    # AR math streams over sequential memory
+    ra = np.ascontiguousarray(d[ra_key], dtype=np.float64)
+    dec = np.ascontiguousarray(d[dec_key], dtype=np.float64)
+    pmra = np.ascontiguousarray(d[pmra_key], dtype=np.float64)
+    pmdec = np.ascontiguousarray(d[pmdec_key], dtype=np.float64)
+    parallax = np.ascontiguousarray(d[parallax_key], dtype=np.float64)
+    ref_epoch = np.ascontiguousarray(d[ref_epoch_key], dtype=np.float64)
     nowra, nowdec = get_nowradec(
-        d[ra_key],
-        d[dec_key],
-        d[pmra_key],
-        d[pmdec_key],
-        d[parallax_key],
-        d[ref_epoch_key],
-        pmtime_utc_str,
+        ra,
+        dec,
+        pmra,
+        pmdec,
+        parallax,
+        ref_epoch,
+        pmtime_utc_jyear,
+        pmtime_utc_mjd,
         scnd=scnd,
     )
     if scnd == True:
@@ -479,15 +678,19 @@ def update_nowradec(
         keep = d["REF_EPOCH"] > 0
     else:
         # AR targets with REF_EPOCH>0 and passing the AEN criterion
+        # AR the AEN criterion is only evaluated on the REF_EPOCH>0 subset,
+        # AR as the other rows are discarded anyway
         keep = d["REF_EPOCH"] > 0
         # AR gaia_psflike arguments changed at desitarget-0.58.0
         if desitarget.__version__ < "0.58.0":
-            keep &= gaia_psflike(d[gaiag_key], d[gaiaaen_key])
+            keep[keep] = gaia_psflike(d[gaiag_key][keep], d[gaiaaen_key][keep])
         else:
-            keep &= gaia_psflike(d[gaiag_key], d[gaiaaen_key], dr=gaiadr)
+            keep[keep] = gaia_psflike(
+                d[gaiag_key][keep], d[gaiaaen_key][keep], dr=gaiadr
+            )
     # AR storing changes to report extrema in the log
-    dra = nowra - d[ra_key]
-    ddec = nowdec - d[dec_key]
+    dra = nowra - ra
+    ddec = nowdec - dec
     # AR updating positions to pmtime_utc_str for targets passing the AEN criterion
     d[ra_key][keep] = nowra[keep]
     d[dec_key][keep] = nowdec[keep]
@@ -505,7 +708,7 @@ def update_nowradec(
         )
     )
     # AR updating REF_EPOCH for *all* objects (for PlateMaker)
-    d[ref_epoch_key] = pmtime_utc_jyear
+    d[ref_epoch_key].fill(pmtime_utc_jyear)
     log.info(
         "{:.1f}s\tupdating REF_EPOCH to {} for all {} targets".format(
             time() - start, pmtime_utc_jyear, len(keep)
@@ -544,14 +747,21 @@ def assert_env_vars(
         will exit with error if some assertions are not verified 
     """
     # AR safe: DESI environment variables
-    for required_env_var in required_env_vars:
-        if os.getenv(required_env_var) is None:
+    # AR single pass over the environment; report all the missing variables
+    # AR before exiting, rather than stopping at the first one
+    missing = [
+        required_env_var
+        for required_env_var in required_env_vars
+        if os.getenv(required_env_var) is None
+    ]
+    if len(missing) > 0:
+        for required_env_var in missing:
             log.error(
                 "{:.1f}s\t{}\tenvironment variable {} not defined; exiting".format(
                     time() - start, step, required_env_var
                 )
             )
-            sys.exit(1)
+        sys.exit(1)
 
 
 def assert_arg_dates(
@@ -610,7 +820,8 @@ def assert_svn_tileid(
     svn_fn = os.path.join(
         svn_trunk, "{:06d}".format(tileid)[:3], "fiberassign-{:06d}.fits".format(tileid)
     )
-    if os.path.isfile(svn_fn) | os.path.isfile("{}.gz".format(svn_fn)):
+    # AR single directory listing instead of one isfile per extension
+    if len(glob("{}*".format(svn_fn))) > 0:
         log.warning(
             "{:.1f}s\t{}\tTILEID={} already exists in SVN folder {}".format(
                 time() - start, step, tileid, svn_trunk
@@ -805,13 +1016,18 @@ def get_desitarget_paths(
     )
 
     # AR log
-    for key in list(mydirs.keys()):
+    # AR batching the existence checks: each stat is a metadata RPC on a
+    # AR networked filesystem (NERSC GPFS/Lustre), so issue them concurrently
+    keys = list(mydirs.keys())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        exists = list(pool.map(os.path.exists, [mydirs[key] for key in keys]))
+    for key, exist in zip(keys, exists):
         log.info(
             "{:.1f}s\t{}\tdirectory for {}: {}".format(
                 time() - start, step, key, mydirs[key]
             )
         )
-        if not os.path.exists(mydirs[key]):
+        if not exist:
             log.warning(
                 "{:.1f}s\t{}\tdirectory for {}: {} does not exist".format(
                     time() - start, step, key, mydirs[key]
@@ -918,7 +1134,7 @@ def create_sky(
     log.info("{:.1f}s\t{}\tTIMESTAMP={}".format(time() - start, step, Time.now().isot))
     log.info("{:.1f}s\t{}\tstart generating {}".format(time() - start, step, outfn))
     # AR sky: read targets
-    tiles = fits.open(tilesfn)[1].data
+    tiles = fitsio.read(tilesfn, ext=1)
     skydirs = [skydir]
     if suppskydir is not None:
         skydirs.append(suppskydir)
@@ -976,7 +1192,7 @@ def create_targ_nomtl(
     log.info("{:.1f}s\t{}\tTIMESTAMP={}".format(time() - start, step, Time.now().isot))
     log.info("{:.1f}s\t{}\tstart generating {}".format(time() - start, step, outfn))
     # AR targ_nomtl: read targets
-    tiles = fits.open(tilesfn)[1].data
+    tiles = fitsio.read(tilesfn, ext=1)
     d = custom_read_targets_in_tiles(
         [targdir], tiles, quick=quick, mtl=False, log=log, step=step, start=start
     )
@@ -1072,7 +1288,7 @@ def create_mtl(
     log.info("")
     log.info("{:.1f}s\t{}\tTIMESTAMP={}".format(time() - start, step, Time.now().isot))
     log.info("{:.1f}s\t{}\tstart generating {}".format(time() - start, step, outfn))
-    tiles = fits.open(tilesfn)[1].data
+    tiles = fitsio.read(tilesfn, ext=1)
     # AR mtl: storing the timestamp at which we queried MTL
     log.info("{:.1f}s\t{}\tmtltime={}".format(time() - start, step, mtltime))
 
@@ -1226,7 +1442,7 @@ def create_too(
 
     # AR too: if yes, we proceed
     # AR too: tile file
-    tiles = fits.open(tilesfn)[1].data
+    tiles = fitsio.read(tilesfn, ext=1)
 
     # AR too: read too file
     # AR cut on:
@@ -1347,7 +1563,7 @@ def launch_onetile_fa(
         targfns = [targfns]
 
     # AR tileid
-    tileid = fits.open(tilesfn)[1].data["TILEID"][0]
+    tileid = fitsio.read(tilesfn, ext=1, columns=["TILEID"])["TILEID"][0]
 
     # AR output directory (picking the one of fbafn)
     outdir = os.path.dirname(fbafn)
@@ -1768,7 +1984,7 @@ def get_parent_assign_quants(
     for key in keys:
         parent[key] = []
     for targfn in targfns:
-        d = fits.open(targfn)[1].data
+        d = fitsio.read(targfn, ext=1)
         for key in keys:
             if key in ["DESI_TARGET", "BGS_TARGET", "MWS_TARGET", "SCND_TARGET",]:
                 if survey.lower()[:2] == "sv":
@@ -1791,7 +2007,7 @@ def get_parent_assign_quants(
     )
 
     # AR fiberassign
-    d = fits.open(fiberassignfn)[1].data
+    d = fitsio.read(fiberassignfn, ext=1)
     # AR
     for key in ["SKY", "BAD", "TGT"]:
         nassign[key] = (d["OBJTYPE"] == key).sum()